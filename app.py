@@ -1,11 +1,23 @@
 import os
-from flask import Flask, jsonify, request, render_template
+import hashlib
+from flask import Flask, jsonify, request, render_template, Response, stream_with_context
 from flask_cors import CORS
+from flask_compress import Compress
+from cachetools import TTLCache
 import psycopg2
+from psycopg2 import pool
 import json
 
 app = Flask(__name__, template_folder='templates')
-CORS(app) 
+CORS(app)
+
+# 🛠️ OPTIMIZATION: GeoJSON is highly repetitive text that compresses to
+# ~10% of its size — bandwidth dominates latency for the map layers on
+# mobile connections.
+app.config['COMPRESS_MIMETYPES'] = ['application/json']
+app.config['COMPRESS_LEVEL'] = 5
+app.config['COMPRESS_MIN_SIZE'] = 1024
+Compress(app)
 
 # ⚠️ CONFIGURATION
 # Production: Uses Render's Environment Variable
@@ -13,19 +25,52 @@ CORS(app)
 DB_URL = os.environ.get("DATABASE_URL")
 LOCAL_DB_CONFIG = "dbname='street_guide' user='postgres' password='admin' host='localhost'"
 
-def get_db_connection():
+# 🛠️ OPTIMIZATION: One process-wide pool instead of a fresh TCP+TLS+auth
+# handshake per request. Connections are borrowed per request and returned
+# via put_db_connection() instead of being closed.
+db_pool = None
+
+def init_db_pool():
+    global db_pool
     try:
         if DB_URL:
             # PROD: Add SSL mode for security
             conn_str = f"{DB_URL}?sslmode=require" if "?" not in DB_URL else DB_URL
-            return psycopg2.connect(conn_str)
+            db_pool = pool.ThreadedConnectionPool(minconn=2, maxconn=15, dsn=conn_str)
         else:
             # LOCAL
-            return psycopg2.connect(LOCAL_DB_CONFIG)
+            db_pool = pool.ThreadedConnectionPool(minconn=2, maxconn=15, dsn=LOCAL_DB_CONFIG)
+    except Exception as e:
+        print(f"❌ Database Pool Creation Failed: {e}")
+        db_pool = None
+
+def get_db_connection():
+    global db_pool
+    try:
+        if db_pool is None:
+            init_db_pool()
+        return db_pool.getconn() if db_pool else None
     except Exception as e:
         print(f"❌ Database Connection Failed: {e}")
         return None
 
+def put_db_connection(conn):
+    # Return the connection to the pool (replaces conn.close())
+    if conn is not None and db_pool is not None:
+        db_pool.putconn(conn)
+
+# 🛠️ OPTIMIZATION: In-process cache for responses that change ~never
+# (boundaries) or slowly (stats). Stores already-serialized JSON so cache
+# hits skip both the DB query and the serialization.
+_cache = TTLCache(maxsize=32, ttl=3600)
+
+def json_cache_response(body):
+    # Serve pre-serialized JSON with browser/CDN caching headers
+    resp = Response(body, mimetype='application/json')
+    resp.headers['Cache-Control'] = 'public, max-age=3600'
+    resp.set_etag(hashlib.md5(body.encode()).hexdigest())
+    return resp.make_conditional(request)
+
 @app.route('/')
 def home():
     return render_template('index.html')
@@ -37,31 +82,33 @@ def home():
 def get_features(category):
     conn = get_db_connection()
     if not conn: return jsonify([]), 500
-    cur = conn.cursor()
-    
+
     search_term = f"%{category}%"
-    
+
+    # 🛠️ OPTIMIZATION: Fetch the FeatureCollection as text and pass the
+    # bytes straight through — jsonify would parse and re-serialize the
+    # whole payload a second time in Python.
     query = """
-        SELECT json_build_object(
+        SELECT (jsonb_build_object(
             'type', 'FeatureCollection',
-            'features', json_agg(ST_AsGeoJSON(t.*)::json)
-        )
+            'features', COALESCE(jsonb_agg(ST_AsGeoJSON(t.*)::jsonb), '[]'::jsonb)
+        ))::text
         FROM (
-            SELECT name, category, geom 
-            FROM point_features 
+            SELECT name, category, geom
+            FROM point_features
             WHERE category ILIKE %s
         ) AS t;
     """
-    cur.execute(query, (search_term,))
-    result = cur.fetchone()[0]
-    
-    cur.close()
-    conn.close()
-    
-    if result is None or result.get('features') is None:
-        return jsonify({"type": "FeatureCollection", "features": []})
-        
-    return jsonify(result)
+    # try/finally so a query error can't leak the pooled connection
+    try:
+        cur = conn.cursor()
+        cur.execute(query, (search_term,))
+        body = cur.fetchone()[0]
+        cur.close()
+    finally:
+        put_db_connection(conn)
+
+    return Response(body, mimetype='application/json')
 
 # ---------------------------------------------------------
 # 2. SHORTEST PATH / ROUTING (Fixed Column Name)
@@ -73,39 +120,58 @@ def get_route():
     end_lat, end_lng = data['end_lat'], data['end_lng']
 
     conn = get_db_connection()
-    cur = conn.cursor()
-
-    # Find nearest nodes
-    sql_start = """
-    SELECT id FROM roads_vertices_pgr 
-    ORDER BY geom <-> ST_SetSRID(ST_MakePoint(%s, %s), 4326) LIMIT 1;
-    """
-    cur.execute(sql_start, (start_lng, start_lat))
-    start_node = cur.fetchone()[0]
+    # try/finally so a query error can't leak the pooled connection
+    try:
+        cur = conn.cursor()
 
-    cur.execute(sql_start, (end_lng, end_lat))
-    end_node = cur.fetchone()[0]
+        # Find nearest nodes
+        # 🛠️ OPTIMIZATION: Both KNN lookups run as LATERAL subqueries of one
+        # statement, halving the round-trips before routing starts.
+        sql_nodes = """
+            SELECT s.id, e.id
+            FROM (VALUES (
+                ST_SetSRID(ST_MakePoint(%s, %s), 4326),
+                ST_SetSRID(ST_MakePoint(%s, %s), 4326)
+            )) AS pts(p1, p2)
+            CROSS JOIN LATERAL (
+                SELECT id FROM roads_vertices_pgr ORDER BY geom <-> pts.p1 LIMIT 1
+            ) s
+            CROSS JOIN LATERAL (
+                SELECT id FROM roads_vertices_pgr ORDER BY geom <-> pts.p2 LIMIT 1
+            ) e;
+        """
+        cur.execute(sql_nodes, (start_lng, start_lat, end_lng, end_lat))
+        start_node, end_node = cur.fetchone()
+
+        # 🛠️ OPTIMIZATION: Pre-filter the edges with a bounding box around the
+        # trip so pgRouting loads ~1% of the network instead of the whole table.
+        min_lng, max_lng = min(start_lng, end_lng) - 0.01, max(start_lng, end_lng) + 0.01
+        min_lat, max_lat = min(start_lat, end_lat) - 0.01, max(start_lat, end_lat) + 0.01
+        edges_sql = (
+            "SELECT id, source, target, cost, reverse_cost FROM roads "
+            f"WHERE geom && ST_MakeEnvelope({min_lng}, {min_lat}, {max_lng}, {max_lat}, 4326)"
+        )
 
-    # Dijkstra Routing
-    # 🛠️ FIX: Used "ROADNAME" and COALESCE
-    sql_route = f"""
-        SELECT json_build_object(
-            'type', 'FeatureCollection',
-            'features', json_agg(ST_AsGeoJSON(row.*)::json)
-        ) FROM (
-            SELECT r.id, COALESCE(r."ROADNAME", 'Road') AS name, r.geom 
-            FROM pgr_dijkstra(
-                'SELECT id, source, target, cost, reverse_cost FROM roads',
-                {start_node}, {end_node}, directed := false
-            ) AS d
-            JOIN roads r ON d.edge = r.id
-        ) row;
-    """
-    cur.execute(sql_route)
-    result = cur.fetchone()[0]
-    cur.close()
-    conn.close()
-    return jsonify(result if result else {"type": "FeatureCollection", "features": []})
+        # Dijkstra Routing
+        # 🛠️ OPTIMIZATION: Bind the edge SQL and node ids as parameters — safe
+        # against injection, and the constant query text lets Postgres reuse
+        # the parse/plan instead of re-planning per (start, end) pair.
+        sql_route = """
+            SELECT (jsonb_build_object(
+                'type', 'FeatureCollection',
+                'features', COALESCE(jsonb_agg(ST_AsGeoJSON(row.*)::jsonb), '[]'::jsonb)
+            ))::text FROM (
+                SELECT r.id, COALESCE(r.roadname, 'Road') AS name, r.geom
+                FROM pgr_bdDijkstra(%s, %s, %s, directed := false) AS d
+                JOIN roads r ON d.edge = r.id
+            ) row;
+        """
+        cur.execute(sql_route, (edges_sql, start_node, end_node))
+        body = cur.fetchone()[0]
+        cur.close()
+    finally:
+        put_db_connection(conn)
+    return Response(body, mimetype='application/json')
 
 # ---------------------------------------------------------
 # 3. BUFFER ANALYSIS
@@ -118,28 +184,30 @@ def get_buffer():
     dist = data['distance']
     
     conn = get_db_connection()
-    cur = conn.cursor()
-    
+
     query = """
-        SELECT json_build_object(
+        SELECT (jsonb_build_object(
             'type', 'FeatureCollection',
-            'features', json_agg(ST_AsGeoJSON(t.*)::json)
-        )
+            'features', COALESCE(jsonb_agg(ST_AsGeoJSON(t.*)::jsonb), '[]'::jsonb)
+        ))::text
         FROM (
-            SELECT name, category, geom 
-            FROM point_features 
+            SELECT name, category, geom
+            FROM point_features
             WHERE ST_DWithin(
-                geom::geography, 
-                ST_SetSRID(ST_MakePoint(%s, %s), 4326)::geography, 
+                geom::geography,
+                ST_SetSRID(ST_MakePoint(%s, %s), 4326)::geography,
                 %s
             )
         ) AS t;
     """
-    cur.execute(query, (lng, lat, dist))
-    result = cur.fetchone()[0]
-    cur.close()
-    conn.close()
-    return jsonify(result if result else {"type": "FeatureCollection", "features": []})
+    try:
+        cur = conn.cursor()
+        cur.execute(query, (lng, lat, dist))
+        body = cur.fetchone()[0]
+        cur.close()
+    finally:
+        put_db_connection(conn)
+    return Response(body, mimetype='application/json')
 
 # ---------------------------------------------------------
 # 4. GET ALL LCDA BOUNDARIES (Optimized)
@@ -147,29 +215,37 @@ def get_buffer():
 @app.route('/api/lcdas', methods=['GET'])
 def get_lcdas():
     try:
-        conn = get_db_connection()
-        if not conn: return jsonify({"features": []})
-        cur = conn.cursor()
-        
-        # 🛠️ FIX: Use ST_Simplify(geom, 0.0001) to reduce size
-        query = """
-            SELECT json_build_object(
-                'type', 'FeatureCollection',
-                'features', json_agg(
-                    json_build_object(
-                        'type', 'Feature',
-                        'geometry', ST_AsGeoJSON(ST_Simplify(geom, 0.0001), 5)::json,
-                        'properties', json_build_object('name', name)
-                    )
-                )
-            )
-            FROM lcda_polygons;
-        """
-        cur.execute(query)
-        result = cur.fetchone()[0]
-        cur.close()
-        conn.close()
-        return jsonify(result if result else {"type": "FeatureCollection", "features": []})
+        body = _cache.get('lcdas')
+        if body is None:
+            conn = get_db_connection()
+            if not conn: return jsonify({"features": []})
+
+            # 🛠️ FIX: Use ST_Simplify(geom, 0.0001) to reduce size
+            # ::text keeps the payload as one string end-to-end instead of
+            # parsing it into a dict and re-serializing it with jsonify
+            query = """
+                SELECT (jsonb_build_object(
+                    'type', 'FeatureCollection',
+                    'features', COALESCE(jsonb_agg(
+                        jsonb_build_object(
+                            'type', 'Feature',
+                            'geometry', ST_AsGeoJSON(ST_Simplify(geom, 0.0001), 5)::jsonb,
+                            'properties', jsonb_build_object('name', name)
+                        )
+                    ), '[]'::jsonb)
+                ))::text
+                FROM lcda_polygons;
+            """
+            # try/finally so a query error can't leak the pooled connection
+            try:
+                cur = conn.cursor()
+                cur.execute(query)
+                body = cur.fetchone()[0]
+                cur.close()
+            finally:
+                put_db_connection(conn)
+            _cache['lcdas'] = body
+        return json_cache_response(body)
     except Exception as e:
         print(f"LCDA Error: {e}")
         return jsonify({"type": "FeatureCollection", "features": []})
@@ -179,38 +255,34 @@ def get_lcdas():
 # ---------------------------------------------------------
 @app.route('/api/roads_layer', methods=['GET'])
 def get_roads_layer():
-    conn = get_db_connection()
-    if not conn: return jsonify({"features": []})
-    cur = conn.cursor()
-    
-    # 🛠️ OPTIMIZATION:
-    # 1. Simplify geometry (0.0001) reduces file size significantly.
-    # 2. WHERE ST_Length > 50 filters out tiny segments to prevent server crashes.
-    query = """
-        SELECT json_build_object(
-            'type', 'FeatureCollection',
-            'features', json_agg(
-                json_build_object(
-                    'type', 'Feature',
-                    'geometry', ST_AsGeoJSON(ST_Simplify(geom, 0.0001), 5)::json,
-                    'properties', json_build_object('name', COALESCE("ROADNAME", 'Road'))
-                )
-            )
-        )
-        FROM roads
-        WHERE ST_Length(geom::geography) > 50; 
-    """
-    try:
-        cur.execute(query)
-        result = cur.fetchone()[0]
-    except Exception as e:
-        print(f"Road Layer Error: {e}")
-        conn.rollback()
-        result = None
-
-    cur.close()
-    conn.close()
-    return jsonify(result if result else {"type": "FeatureCollection", "features": []})
+    # 🛠️ OPTIMIZATION: Features are precomputed per road in the
+    # materialized view (see upload_data.py). A server-side cursor pulls
+    # them in batches and the response streams out as it is built, so peak
+    # memory is one batch instead of the whole multi-MB layer.
+    def generate():
+        conn = get_db_connection()
+        if not conn:
+            yield '{"type": "FeatureCollection", "features": []}'
+            return
+        try:
+            cur = conn.cursor(name='roads_stream')  # server-side cursor
+            cur.itersize = 500
+            cur.execute("SELECT feature FROM roads_geojson_mv;")
+            yield '{"type": "FeatureCollection", "features": ['
+            prefix = ''
+            for (feature,) in cur:
+                yield prefix + feature
+                prefix = ','
+            yield ']}'
+            cur.close()
+        except Exception as e:
+            print(f"Road Layer Error: {e}")
+            conn.rollback()
+            yield '{"type": "FeatureCollection", "features": []}'
+        finally:
+            put_db_connection(conn)
+
+    return Response(stream_with_context(generate()), mimetype='application/json')
 
 # ---------------------------------------------------------
 # 6. GET PROJECT BOUNDARY (Optimized)
@@ -218,29 +290,34 @@ def get_roads_layer():
 @app.route('/api/boundary', methods=['GET'])
 def get_boundary():
     try:
-        conn = get_db_connection()
-        if not conn: return jsonify({"features": []})
-        cur = conn.cursor()
-        
-        # 🛠️ FIX: Use ST_Simplify(geom, 0.0001) here too
-        query = """
-            SELECT json_build_object(
-                'type', 'FeatureCollection',
-                'features', json_agg(
-                    json_build_object(
-                        'type', 'Feature',
-                        'geometry', ST_AsGeoJSON(ST_Simplify(geom, 0.0001), 5)::json,
-                        'properties', json_build_object('name', 'Project Boundary')
-                    )
-                )
-            )
-            FROM boundary;
-        """
-        cur.execute(query)
-        result = cur.fetchone()[0]
-        cur.close()
-        conn.close()
-        return jsonify(result if result else {"type": "FeatureCollection", "features": []})
+        body = _cache.get('boundary')
+        if body is None:
+            conn = get_db_connection()
+            if not conn: return jsonify({"features": []})
+
+            # 🛠️ FIX: Use ST_Simplify(geom, 0.0001) here too
+            query = """
+                SELECT (jsonb_build_object(
+                    'type', 'FeatureCollection',
+                    'features', COALESCE(jsonb_agg(
+                        jsonb_build_object(
+                            'type', 'Feature',
+                            'geometry', ST_AsGeoJSON(ST_Simplify(geom, 0.0001), 5)::jsonb,
+                            'properties', jsonb_build_object('name', 'Project Boundary')
+                        )
+                    ), '[]'::jsonb)
+                ))::text
+                FROM boundary;
+            """
+            try:
+                cur = conn.cursor()
+                cur.execute(query)
+                body = cur.fetchone()[0]
+                cur.close()
+            finally:
+                put_db_connection(conn)
+            _cache['boundary'] = body
+        return json_cache_response(body)
     except Exception as e:
         print(f"Boundary Error: {e}")
         return jsonify({"type": "FeatureCollection", "features": []})
@@ -255,29 +332,35 @@ def search_all():
         return jsonify([])
 
     conn = get_db_connection()
-    cur = conn.cursor()
-    
-    # 🛠️ FIX: Changed roadname to "ROADNAME"
+
+    # 🛠️ OPTIMIZATION: The ILIKE filters are served by the pg_trgm GIN
+    # indexes (see upload_data.py), similarity() ranking surfaces the best
+    # matches first, and lng/lat are stored generated columns so no
+    # ST_Centroid runs at query time.
     sql = """
-        SELECT name, category, ST_X(ST_Centroid(geom)) as lng, ST_Y(ST_Centroid(geom)) as lat
+        SELECT name, category, lng, lat
         FROM (
-            SELECT name, category, geom FROM point_features WHERE name ILIKE %s
+            SELECT name, category, lng, lat FROM point_features WHERE name ILIKE %s
             UNION ALL
-            SELECT "ROADNAME" as name, 'Road' as category, geom FROM roads WHERE "ROADNAME" ILIKE %s
+            SELECT roadname as name, 'Road' as category, lng, lat FROM roads WHERE roadname ILIKE %s
             UNION ALL
-            SELECT name, 'District' as category, geom FROM lcda_polygons WHERE name ILIKE %s
+            SELECT name, 'District' as category, lng, lat FROM lcda_polygons WHERE name ILIKE %s
         ) as combined_results
+        ORDER BY similarity(name, %s) DESC
         LIMIT 10;
     """
     wildcard_query = f"%{query_text}%"
-    cur.execute(sql, (wildcard_query, wildcard_query, wildcard_query))
-    
-    results = []
-    for row in cur.fetchall():
-        results.append({"name": row[0], "category": row[1], "lng": row[2], "lat": row[3]})
-        
-    cur.close()
-    conn.close()
+    try:
+        cur = conn.cursor()
+        cur.execute(sql, (wildcard_query, wildcard_query, wildcard_query, query_text))
+
+        results = []
+        for row in cur.fetchall():
+            results.append({"name": row[0], "category": row[1], "lng": row[2], "lat": row[3]})
+
+        cur.close()
+    finally:
+        put_db_connection(conn)
     return jsonify(results)
 
 # ---------------------------------------------------------
@@ -291,103 +374,110 @@ def get_nearest():
     category = data['category']
 
     conn = get_db_connection()
-    cur = conn.cursor()
-
     search_term = f"%{category}%"
 
-    # 1. Find the Geometrically Nearest Item
-    sql_find_closest = """
-        SELECT name, category, ST_X(geom), ST_Y(geom)
-        FROM point_features
-        WHERE category ILIKE %s
-        ORDER BY geom <-> ST_SetSRID(ST_MakePoint(%s, %s), 4326)
-        LIMIT 1;
-    """
-    cur.execute(sql_find_closest, (search_term, lng, lat))
-    target = cur.fetchone()
+    # try/finally so a query error can't leak the pooled connection
+    try:
+        cur = conn.cursor()
 
-    if not target:
-        cur.close()
-        conn.close()
-        return jsonify({"type": "FeatureCollection", "features": []})
+        # 🛠️ OPTIMIZATION: One CTE finds the nearest POI *and* the start/end
+        # routing nodes in a single round-trip instead of three queries.
+        sql_locate = """
+            WITH tgt AS (
+                SELECT name, category, lng, lat, geom
+                FROM point_features
+                WHERE category ILIKE %s
+                ORDER BY geom <-> ST_SetSRID(ST_MakePoint(%s, %s), 4326)
+                LIMIT 1
+            ),
+            sn AS (
+                SELECT id FROM roads_vertices_pgr
+                ORDER BY geom <-> ST_SetSRID(ST_MakePoint(%s, %s), 4326) LIMIT 1
+            ),
+            en AS (
+                SELECT id FROM roads_vertices_pgr
+                ORDER BY geom <-> (SELECT geom FROM tgt) LIMIT 1
+            )
+            SELECT t.name, t.category, t.lng, t.lat,
+                   (SELECT id FROM sn), (SELECT id FROM en)
+            FROM tgt t;
+        """
+        cur.execute(sql_locate, (search_term, lng, lat, lng, lat))
+        target = cur.fetchone()
+
+        if not target:
+            cur.close()
+            return jsonify({"type": "FeatureCollection", "features": []})
+
+        target_name, target_cat, target_lng, target_lat, start_node, end_node = target
+
+        # 2. Try to Route to it (Dijkstra)
+        route_res = None
+        if start_node is not None and end_node is not None:
+            # 🛠️ OPTIMIZATION: Same bounding-box pre-filter as /api/route
+            min_lng, max_lng = min(lng, target_lng) - 0.01, max(lng, target_lng) + 0.01
+            min_lat, max_lat = min(lat, target_lat) - 0.01, max(lat, target_lat) + 0.01
+            edges_sql = (
+                "SELECT id, source, target, cost, reverse_cost FROM roads "
+                f"WHERE geom && ST_MakeEnvelope({min_lng}, {min_lat}, {max_lng}, {max_lat}, 4326)"
+            )
 
-    target_name, target_cat, target_lng, target_lat = target
+            # Bound parameters as in /api/route: injection-safe + plan reuse
+            sql_route = """
+                SELECT ST_AsGeoJSON(ST_Union(r.geom)), SUM(r.cost)
+                FROM pgr_bdDijkstra(%s, %s, %s, directed := false) AS d
+                JOIN roads r ON d.edge = r.id;
+            """
+            cur.execute(sql_route, (edges_sql, start_node, end_node))
+            route_res = cur.fetchone()
 
-    # 2. Try to Route to it (Dijkstra)
-    cur.execute("""
-        SELECT id FROM roads_vertices_pgr 
-        ORDER BY geom <-> ST_SetSRID(ST_MakePoint(%s, %s), 4326) LIMIT 1;
-    """, (lng, lat))
-    start_node_row = cur.fetchone()
-    
-    cur.execute("""
-        SELECT id FROM roads_vertices_pgr 
-        ORDER BY geom <-> ST_SetSRID(ST_MakePoint(%s, %s), 4326) LIMIT 1;
-    """, (target_lng, target_lat))
-    end_node_row = cur.fetchone()
-
-    route_res = None
-    if start_node_row and end_node_row:
-        start_node = start_node_row[0]
-        end_node = end_node_row[0]
-
-        sql_route = f"""
-            SELECT ST_AsGeoJSON(ST_Union(r.geom)), SUM(r.cost)
-            FROM pgr_dijkstra(
-                'SELECT id, source, target, cost, reverse_cost FROM roads',
-                {start_node}, {end_node}, directed := false
-            ) AS d
-            JOIN roads r ON d.edge = r.id;
-        """
-        cur.execute(sql_route)
-        route_res = cur.fetchone()
-    
-    features = []
-    
-    # Destination Point
-    features.append({
-        "type": "Feature",
-        "geometry": { "type": "Point", "coordinates": [target_lng, target_lat] },
-        "properties": { "name": target_name, "category": target_cat, "is_target": True }
-    })
+        features = []
 
-    if route_res and route_res[0]:
-        route_geom = json.loads(route_res[0])
-        total_dist = round(route_res[1]) 
-        
+        # Destination Point
         features.append({
             "type": "Feature",
-            "geometry": route_geom,
-            "properties": { 
-                "type": "route", 
-                "distance_msg": f"Road Distance: {total_dist}m" 
-            }
+            "geometry": { "type": "Point", "coordinates": [target_lng, target_lat] },
+            "properties": { "name": target_name, "category": target_cat, "is_target": True }
         })
-    else:
-        # Fallback: Straight Line
-        cur.execute("""
-            SELECT ST_Distance(
-                ST_SetSRID(ST_MakePoint(%s, %s), 4326)::geography,
-                ST_SetSRID(ST_MakePoint(%s, %s), 4326)::geography
-            )
-        """, (lng, lat, target_lng, target_lat))
-        straight_dist = round(cur.fetchone()[0])
 
-        features.append({
-            "type": "Feature",
-            "geometry": {
-                "type": "LineString",
-                "coordinates": [[lng, lat], [target_lng, target_lat]]
-            },
-            "properties": { 
-                "type": "route", 
-                "style": "dashed",
-                "distance_msg": f"Straight Distance: {straight_dist}m (No road path)" 
-            }
-        })
+        if route_res and route_res[0]:
+            route_geom = json.loads(route_res[0])
+            total_dist = round(route_res[1])
+
+            features.append({
+                "type": "Feature",
+                "geometry": route_geom,
+                "properties": {
+                    "type": "route",
+                    "distance_msg": f"Road Distance: {total_dist}m"
+                }
+            })
+        else:
+            # Fallback: Straight Line
+            cur.execute("""
+                SELECT ST_Distance(
+                    ST_SetSRID(ST_MakePoint(%s, %s), 4326)::geography,
+                    ST_SetSRID(ST_MakePoint(%s, %s), 4326)::geography
+                )
+            """, (lng, lat, target_lng, target_lat))
+            straight_dist = round(cur.fetchone()[0])
+
+            features.append({
+                "type": "Feature",
+                "geometry": {
+                    "type": "LineString",
+                    "coordinates": [[lng, lat], [target_lng, target_lat]]
+                },
+                "properties": {
+                    "type": "route",
+                    "style": "dashed",
+                    "distance_msg": f"Straight Distance: {straight_dist}m (No road path)"
+                }
+            })
 
-    cur.close()
-    conn.close()
+        cur.close()
+    finally:
+        put_db_connection(conn)
     return jsonify({"type": "FeatureCollection", "features": features})
 
 # ---------------------------------------------------------
@@ -400,55 +490,62 @@ def identify_location():
     lng = data['lng']
 
     conn = get_db_connection()
-    cur = conn.cursor()
-    
+
     query = """
-        SELECT json_build_object(
+        SELECT (jsonb_build_object(
             'type', 'FeatureCollection',
-            'features', json_agg(ST_AsGeoJSON(t.*)::json)
-        )
+            'features', COALESCE(jsonb_agg(ST_AsGeoJSON(t.*)::jsonb), '[]'::jsonb)
+        ))::text
         FROM (
-            SELECT name, geom 
-            FROM lcda_polygons 
+            SELECT name, geom
+            FROM lcda_polygons
             WHERE ST_Intersects(geom, ST_SetSRID(ST_MakePoint(%s, %s), 4326))
         ) AS t;
     """
-    cur.execute(query, (lng, lat))
-    result = cur.fetchone()[0]
-    cur.close()
-    conn.close()
-    return jsonify(result if result else {"type": "FeatureCollection", "features": []})
+    try:
+        cur = conn.cursor()
+        cur.execute(query, (lng, lat))
+        body = cur.fetchone()[0]
+        cur.close()
+    finally:
+        put_db_connection(conn)
+    return Response(body, mimetype='application/json')
 
 # ---------------------------------------------------------
 # 10. DESCRIPTIVE STATISTICS
 # ---------------------------------------------------------
 @app.route('/api/stats', methods=['GET'])
 def get_stats():
-    conn = get_db_connection()
-    cur = conn.cursor()
-
-    cur.execute("""
-        SELECT category, COUNT(*) as count 
-        FROM point_features 
-        GROUP BY category 
-        ORDER BY count DESC
-    """)
-    poi_rows = cur.fetchall()
-    
-    cur.execute("SELECT SUM(ST_Length(geom::geography)) / 1000 FROM roads")
-    road_len = cur.fetchone()[0]
-
-    cur.execute("SELECT SUM(ST_Area(geom::geography)) / 1000000 FROM lcda_polygons")
-    area_sqkm = cur.fetchone()[0]
-
-    cur.close()
-    conn.close()
+    body = _cache.get('stats')
+    if body is None:
+        conn = get_db_connection()
 
-    return jsonify({
-        "poi_stats": [{"label": r[0], "value": r[1]} for r in poi_rows],
-        "total_road_km": round(road_len, 2) if road_len else 0,
-        "total_area_sqkm": round(area_sqkm, 2) if area_sqkm else 0
-    })
+        # 🛠️ OPTIMIZATION: One statement instead of three serial round-trips.
+        # Postgres can also run the two expensive geography aggregates with
+        # parallel workers inside the single plan.
+        try:
+            cur = conn.cursor()
+            cur.execute("""
+                WITH poi AS (
+                    SELECT jsonb_agg(jsonb_build_object('label', category, 'value', count)
+                                     ORDER BY count DESC) AS j
+                    FROM (SELECT category, COUNT(*) AS count FROM point_features GROUP BY category) s
+                ),
+                rl AS (SELECT SUM(length_m) / 1000 AS v FROM roads),
+                ar AS (SELECT SUM(area_m2) / 1000000 AS v FROM lcda_polygons)
+                SELECT (jsonb_build_object(
+                    'poi_stats', COALESCE(poi.j, '[]'::jsonb),
+                    'total_road_km', COALESCE(round(rl.v::numeric, 2), 0),
+                    'total_area_sqkm', COALESCE(round(ar.v::numeric, 2), 0)
+                ))::text
+                FROM poi, rl, ar;
+            """)
+            body = cur.fetchone()[0]
+            cur.close()
+        finally:
+            put_db_connection(conn)
+        _cache['stats'] = body
+    return json_cache_response(body)
 
 # ---------------------------------------------------------
 # 11. LCDA SPECIFIC STATS (Fixed Column Name)
@@ -456,54 +553,52 @@ def get_stats():
 @app.route('/api/stats/<lcda_name>', methods=['GET'])
 def get_lcda_stats(lcda_name):
     conn = get_db_connection()
-    cur = conn.cursor()
-    
-    # 1. Area
-    cur.execute("SELECT ST_Area(geom::geography) / 1000000 FROM lcda_polygons WHERE name = %s", (lcda_name,))
-    res_area = cur.fetchone()
-    area = res_area[0] if res_area else 0
-
-    # 2. Roads
-    sql_road = """
-        SELECT COUNT(*), MAX(ST_Length(r.geom::geography))
-        FROM roads r, lcda_polygons l
-        WHERE l.name = %s AND ST_Intersects(r.geom, l.geom)
-    """
-    cur.execute(sql_road, (lcda_name,))
-    road_data = cur.fetchone()
-    road_count = road_data[0]
-    longest_road_len = round(road_data[1]) if road_data[1] else 0
-
-    # 3. Longest Road Name (FIXED: "ROADNAME")
-    sql_longest_name = """
-        SELECT r."ROADNAME" 
-        FROM roads r, lcda_polygons l 
-        WHERE l.name = %s AND ST_Intersects(r.geom, l.geom) 
-        ORDER BY ST_Length(r.geom::geography) DESC LIMIT 1
-    """
-    cur.execute(sql_longest_name, (lcda_name,))
-    res_name = cur.fetchone()
-    longest_road_name = res_name[0] if res_name else "None"
-
-    # 4. POI Stats
-    sql_poi = """
-        SELECT 
-            p.category, 
-            COUNT(*), 
-            json_agg(json_build_object(
-                'name', p.name, 
-                'lat', ST_Y(p.geom::geometry), 
-                'lng', ST_X(p.geom::geometry)
-            )) 
-        FROM point_features p, lcda_polygons l
-        WHERE l.name = %s AND ST_Intersects(p.geom, l.geom)
-        GROUP BY p.category
-    """
-    cur.execute(sql_poi, (lcda_name,))
-    poi_rows = cur.fetchall()
 
-    cur.close()
-    conn.close()
+    try:
+        cur = conn.cursor()
+
+        # 1. Area
+        # length_m / area_m2 are stored generated columns (see upload_data.py)
+        cur.execute("SELECT area_m2 / 1000000 FROM lcda_polygons WHERE name = %s", (lcda_name,))
+        res_area = cur.fetchone()
+        area = res_area[0] if res_area else 0
+
+        # 2 + 3. Roads (count, longest length and longest name in ONE query)
+        # 🛠️ OPTIMIZATION: The road-in-LCDA join is precomputed at ingest in
+        # the road_lcda materialized view, so this is a btree probe instead of
+        # a spatial join per request.
+        sql_road = """
+            SELECT COUNT(*), MAX(length_m), (array_agg(name ORDER BY length_m DESC))[1]
+            FROM road_lcda
+            WHERE lcda = %s;
+        """
+        cur.execute(sql_road, (lcda_name,))
+        road_data = cur.fetchone()
+        road_count = road_data[0]
+        longest_road_len = round(road_data[1]) if road_data[1] else 0
+        longest_road_name = road_data[2] if road_data[2] else "None"
+
+        # 4. POI Stats (precomputed poi_lcda view, same idea)
+        # jsonb_agg over the stored lat/lng scalars — no per-row PostGIS calls
+        sql_poi = """
+            SELECT
+                category,
+                COUNT(*),
+                jsonb_agg(jsonb_build_object(
+                    'name', name,
+                    'lat', lat,
+                    'lng', lng
+                ))
+            FROM poi_lcda
+            WHERE lcda = %s
+            GROUP BY category
+        """
+        cur.execute(sql_poi, (lcda_name,))
+        poi_rows = cur.fetchall()
+
+        cur.close()
+    finally:
+        put_db_connection(conn)
 
     return jsonify({
         "lcda_name": lcda_name,